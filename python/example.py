@@ -79,9 +79,10 @@ def example_mercadopago():
         for i, transaction in enumerate(batch.transactions[:5], 1):
             print(f"  {i}. {transaction}")
 
-        # Calculate total debits and credits
-        debits = sum(t.amount for t in batch.transactions if t.amount < 0)
-        credits = sum(t.amount for t in batch.transactions if t.amount > 0)
+        # Calculate total debits and credits on the columnar view
+        amounts = batch.to_dataframe()['amount']
+        debits = amounts[amounts < 0].sum()
+        credits = amounts[amounts > 0].sum()
 
         print(f"\nSummary:")
         print(f"  Total debits:  {debits:,.2f}")
@@ -125,29 +126,25 @@ def example_custom_processing():
     if ars_batch:
         print(f"\nAnalyzing {len(ars_batch)} ARS transactions...")
 
+        # Columnar view: filters and groupings run vectorized
+        df = ars_batch.to_dataframe()
+        currency = ars_batch.currency.value
+
         # Filter large transactions (absolute value > 50000)
-        large_transactions = [
-            t for t in ars_batch.transactions
-            if abs(t.amount) > 50000
-        ]
+        large_transactions = df[df['amount'].abs() > 50000]
 
         print(f"\nLarge transactions (> 50,000):")
-        if large_transactions:
-            for transaction in large_transactions:
-                print(f"  {transaction}")
+        if not large_transactions.empty:
+            for row in large_transactions.itertuples():
+                print(f"  {row.date.strftime('%d/%m/%Y')} | {row.description} | {row.amount} {currency}")
         else:
             print("  No large transactions found")
 
         # Group by month
-        from collections import defaultdict
-        monthly_totals = defaultdict(float)
-
-        for transaction in ars_batch.transactions:
-            month_key = transaction.date.strftime('%Y-%m')
-            monthly_totals[month_key] += transaction.amount
+        monthly_totals = df.groupby(df['date'].dt.strftime('%Y-%m'))['amount'].sum()
 
         print(f"\nMonthly totals:")
-        for month, total in sorted(monthly_totals.items()):
+        for month, total in monthly_totals.sort_index().items():
             print(f"  {month}: ${total:,.2f}")
 
     print()
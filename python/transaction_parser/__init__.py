@@ -4,10 +4,9 @@ Transaction Parser - A modular and extensible transaction log parser.
 This package provides parsers for different banking providers using the Template Method pattern.
 """
 
+import importlib
+
 from .models import Transaction, TransactionBatch, Currency
-from .parsers.base import TransactionParser
-from .parsers.santander import SantanderParser
-from .parsers.mercadopago import MercadoPagoParser
 
 __version__ = "1.0.0"
 
@@ -20,6 +19,23 @@ __all__ = [
     "MercadoPagoParser",
 ]
 
+# Parser modules pull in pandas/openpyxl; resolve them on first attribute
+# access so importing the package (e.g. to launch the TUI) stays fast
+_LAZY_IMPORTS = {
+    "TransactionParser": "transaction_parser.parsers.base",
+    "SantanderParser": "transaction_parser.parsers.santander",
+    "MercadoPagoParser": "transaction_parser.parsers.mercadopago",
+}
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
 
 def run_tui():
     """Run the interactive TUI mode."""
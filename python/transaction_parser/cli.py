@@ -3,17 +3,19 @@ Command-line interface for the transaction parser.
 """
 
 import argparse
+import importlib
 import sys
 from pathlib import Path
 from typing import Type
 
-from .parsers import TransactionParser, SantanderParser, MercadoPagoParser
+from .parsers import TransactionParser
 
 
-# Registry of available parsers
+# Registry of available parsers as 'module:class' references, resolved
+# lazily so pandas/openpyxl only load for the chosen provider
 PARSERS = {
-    'santander': SantanderParser,
-    'mercadopago': MercadoPagoParser,
+    'santander': 'transaction_parser.parsers.santander:SantanderParser',
+    'mercadopago': 'transaction_parser.parsers.mercadopago:MercadoPagoParser',
 }
 
 
@@ -30,11 +32,12 @@ def get_parser_class(provider: str) -> Type[TransactionParser]:
     Raises:
         ValueError: If provider is not supported
     """
-    parser_class = PARSERS.get(provider.lower())
-    if parser_class is None:
+    target = PARSERS.get(provider.lower())
+    if target is None:
         available = ', '.join(PARSERS.keys())
         raise ValueError(f"Unknown provider '{provider}'. Available: {available}")
-    return parser_class
+    module_name, _, class_name = target.partition(':')
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def main():
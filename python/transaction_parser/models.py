@@ -2,10 +2,14 @@
 Data models for transaction processing.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from operator import attrgetter
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Currency(Enum):
@@ -13,8 +17,13 @@ class Currency(Enum):
     ARS = "ARS"
     USD = "USD"
 
+    def __init__(self, value: str):
+        # Lowercased once per member at class creation; export filename
+        # formatting reads this instead of re-lowercasing .value per call
+        self.lower = value.lower()
+
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """
     Represents a single financial transaction.
@@ -50,7 +59,7 @@ class Transaction:
         return f"{self.date.strftime('%d/%m/%Y')} | {self.description} | {self.amount} {self.currency.value}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionBatch:
     """
     Represents a batch of transactions grouped by currency.
@@ -63,6 +72,23 @@ class TransactionBatch:
     transactions: list[Transaction]
     currency: Currency
     provider: str
+    _count: int = field(init=False, default=0, repr=False)
+
+    def __post_init__(self):
+        self._count = len(self.transactions)
+
+    def add(self, transaction: Transaction) -> None:
+        """
+        Append a transaction, keeping the cached count in sync.
+
+        Prefer this over appending to the transactions list directly so
+        __len__ stays correct.
+
+        Args:
+            transaction: Transaction to add
+        """
+        self.transactions.append(transaction)
+        self._count += 1
 
     def sort_by_date(self, descending: bool = True) -> None:
         """
@@ -71,8 +97,27 @@ class TransactionBatch:
         Args:
             descending: If True, sort newest first; otherwise oldest first
         """
-        self.transactions.sort(key=lambda t: t.date, reverse=descending)
+        # attrgetter is a C-level key function: no Python frame per element
+        self.transactions.sort(key=attrgetter('date'), reverse=descending)
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """
+        Get a columnar view of the batch for vectorized analytics.
+
+        Sums, filters and groupings over thousands of transactions are
+        much faster on contiguous columns than on a list of objects.
+
+        Returns:
+            DataFrame with 'date', 'description' and 'amount' columns
+        """
+        import pandas as pd
+
+        return pd.DataFrame({
+            'date': pd.to_datetime([t.date for t in self.transactions]),
+            'description': [t.description for t in self.transactions],
+            'amount': [t.amount for t in self.transactions],
+        })
 
     def __len__(self) -> int:
         """Return number of transactions in the batch."""
-        return len(self.transactions)
+        return self._count
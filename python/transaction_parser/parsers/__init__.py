@@ -2,12 +2,27 @@
 Transaction parsers for different banking providers.
 """
 
+import importlib
+
 from .base import TransactionParser
-from .santander import SantanderParser
-from .mercadopago import MercadoPagoParser
 
 __all__ = [
     "TransactionParser",
     "SantanderParser",
     "MercadoPagoParser",
 ]
+
+# Concrete parsers import pandas/openpyxl; load them on first access
+_LAZY_IMPORTS = {
+    "SantanderParser": ".santander",
+    "MercadoPagoParser": ".mercadopago",
+}
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,13 +2,27 @@
 MercadoPago-specific transaction parser.
 """
 
+import csv
 import re
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
+from itertools import islice
+
+import pandas as pd
 
 from .base import TransactionParser
 from ..models import Transaction, Currency
 
 
+# Rows are processed in chunks of this size: large enough that the
+# vectorized pandas operations dominate, small enough to keep the
+# working set bounded while streaming.
+_CHUNK_ROWS = 4096
+
+# Transfer prefixes stripped from transaction types, compiled once
+_TRANSFER_RE = re.compile(r'transferencia\s+(enviada|recibida)\s*', re.IGNORECASE)
+
+
 class MercadoPagoParser(TransactionParser):
     """Parser for MercadoPago CSV transaction files."""
 
@@ -16,45 +30,45 @@ class MercadoPagoParser(TransactionParser):
         """Get the provider name."""
         return "mercadopago"
 
-    def read_file(self) -> list[dict]:
+    def read_file(self) -> Iterator[dict]:
         """
-        Read MercadoPago CSV file.
+        Read MercadoPago CSV file lazily.
 
         The CSV has the following structure:
         - First 3 rows are skipped
         - 4th row contains headers
         - Data starts from row 5
 
+        The header is validated eagerly, but data rows are yielded one at
+        a time so large files never have to fit in memory.
+
         Returns:
-            List of dictionaries representing rows
+            Iterator of dictionaries representing rows
         """
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        if len(lines) < 4:
+        f = open(self.file_path, 'r', encoding='utf-8', newline='')
+        try:
+            # Skip the 3-row preamble, header is on the 4th row
+            for _ in range(3):
+                next(f)
+            header_line = next(f).strip()
+        except StopIteration:
+            f.close()
             raise ValueError('CSV file must have at least 4 rows')
 
-        # Get header from 4th row (index 3)
-        header_line = lines[3].strip()
-
-        # Get data from 5th row onwards (index 4+)
-        data_lines = [line.strip() for line in lines[4:] if line.strip()]
-
         # Try to detect separator (comma or semicolon)
         separator = self._detect_separator(header_line)
 
         # Parse header
-        headers = self._parse_csv_line(header_line, separator)
+        headers = [h.strip() for h in next(csv.reader([header_line], delimiter=separator))]
 
-        # Parse data rows
-        rows = []
-        for line in data_lines:
-            values = self._parse_csv_line(line, separator)
-            if len(values) == len(headers):
-                row = dict(zip(headers, values))
-                rows.append(row)
+        def rows() -> Iterator[dict]:
+            # Stream data rows, skipping blank/malformed lines
+            with f:
+                for values in csv.reader(f, delimiter=separator):
+                    if len(values) == len(headers):
+                        yield dict(zip(headers, (v.strip() for v in values)))
 
-        return rows
+        return rows()
 
     def _detect_separator(self, line: str) -> str:
         """
@@ -66,91 +80,50 @@ class MercadoPagoParser(TransactionParser):
         Returns:
             Detected separator (',' or ';')
         """
-        # Count occurrences outside quotes
-        comma_count = 0
-        semicolon_count = 0
-        in_quotes = False
-
-        for char in line:
-            if char == '"':
-                in_quotes = not in_quotes
-            elif not in_quotes:
-                if char == ',':
-                    comma_count += 1
-                elif char == ';':
-                    semicolon_count += 1
-
-        return ';' if semicolon_count > comma_count else ','
-
-    def _parse_csv_line(self, line: str, separator: str = ',') -> list[str]:
+        try:
+            return csv.Sniffer().sniff(line, delimiters=',;').delimiter
+        except csv.Error:
+            return ','
+
+    @staticmethod
+    def _column(df: pd.DataFrame, name: str) -> pd.Series:
         """
-        Parse a single CSV line, handling quoted values.
+        Get a column as strings, defaulting to empty strings if missing.
 
         Args:
-            line: CSV line to parse
-            separator: Separator character
+            df: Chunk of CSV rows
+            name: Column name
 
         Returns:
-            List of field values
+            String Series aligned with the chunk
         """
-        result = []
-        current = ''
-        in_quotes = False
-
-        for i, char in enumerate(line):
-            if char == '"':
-                if in_quotes and i + 1 < len(line) and line[i + 1] == '"':
-                    # Escaped quote
-                    current += '"'
-                    i += 1
-                else:
-                    # Toggle quote state
-                    in_quotes = not in_quotes
-            elif char == separator and not in_quotes:
-                # End of field
-                result.append(current.strip())
-                current = ''
-            else:
-                current += char
-
-        # Add last field
-        result.append(current.strip())
-
-        return result
-
-    def _convert_to_integer(self, argentine_amount: str) -> int | None:
+        if name in df.columns:
+            return df[name].fillna('').astype(str)
+        return pd.Series('', index=df.index)
+
+    @staticmethod
+    def _convert_amounts(amounts: pd.Series) -> pd.Series:
         """
-        Convert Argentine number format to integer.
+        Convert a column of Argentine-format amounts to numbers.
 
         Examples:
-            "1.809,09" -> 1809
-            "-24.000,00" -> -24000
-            "1.514,59" -> 1514
+            "1.809,09" -> 1809.09
+            "-24.000,00" -> -24000.0
+
+        Empty or unparseable values become NaN.
 
         Args:
-            argentine_amount: Amount in Argentine format
+            amounts: Amounts in Argentine format
 
         Returns:
-            Integer amount (removes decimal part) or None
+            Float Series (decimal part is truncated when building transactions)
         """
-        if not argentine_amount or not argentine_amount.strip():
-            return None
-
-        clean_amount = argentine_amount.strip()
-
-        # Handle negative amounts
-        is_negative = clean_amount.startswith('-')
-        if is_negative:
-            clean_amount = clean_amount[1:]
-
-        # Remove dots (thousands separators) and split by comma (decimal separator)
-        parts = clean_amount.replace('.', '').split(',')
-
-        try:
-            integer_part = int(parts[0]) if parts[0] else 0
-            return -integer_part if is_negative else integer_part
-        except ValueError:
-            return None
+        cleaned = (
+            amounts
+            .str.replace('.', '', regex=False)
+            .str.replace(',', '.', regex=False)
+        )
+        return pd.to_numeric(cleaned, errors='coerce')
 
     def _add_one_day_and_format(self, date_str: str) -> datetime | None:
         """
@@ -197,16 +170,9 @@ class MercadoPagoParser(TransactionParser):
             return ''
 
         # Remove "Transferencia enviada" or "Transferencia recibida"
-        cleaned = re.sub(
-            r'transferencia\s+(enviada|recibida)\s*',
-            '',
-            transaction_type,
-            flags=re.IGNORECASE
-        )
-
-        return cleaned.strip()
+        return _TRANSFER_RE.sub('', transaction_type).strip()
 
-    def extract_transactions(self, raw_data: list[dict]) -> list[Transaction]:
+    def extract_transactions(self, raw_data: Iterable[dict]) -> list[Transaction]:
         """
         Extract transactions from MercadoPago CSV data.
 
@@ -217,31 +183,58 @@ class MercadoPagoParser(TransactionParser):
         - TRANSACTION_NET_AMOUNT: Transaction amount
 
         Args:
-            raw_data: List of dictionaries from CSV
+            raw_data: Iterable of dictionaries from CSV
 
         Returns:
             List of Transaction objects
         """
         transactions = []
+        rows = iter(raw_data)
 
-        for row in raw_data:
-            # Extract fields
-            date_str = row.get('RELEASE_DATE', '').strip()
-            transaction_type = row.get('TRANSACTION_TYPE', '').strip()
-            reference_id = row.get('REFERENCE_ID', '').strip()
-            amount_str = row.get('TRANSACTION_NET_AMOUNT', '').strip()
+        while True:
+            chunk = list(islice(rows, _CHUNK_ROWS))
+            if not chunk:
+                break
+            transactions.extend(self._extract_chunk(pd.DataFrame(chunk)))
 
-            # Skip if no date (empty rows)
-            if not date_str:
-                continue
+        return transactions
 
-            # Parse date
-            parsed_date = self._add_one_day_and_format(date_str)
-            if parsed_date is None:
-                continue
+    def _extract_chunk(self, df: pd.DataFrame) -> list[Transaction]:
+        """
+        Extract transactions from one chunk of CSV rows.
+
+        Amount and date conversion run vectorized over the whole chunk;
+        the remaining per-row work only builds Transaction objects.
+
+        Args:
+            df: DataFrame with one dict-row per CSV line
 
-            # Clean transaction type
-            clean_type = self._clean_transaction_type(transaction_type)
+        Returns:
+            List of Transaction objects
+        """
+        date_strs = self._column(df, 'RELEASE_DATE')
+        types = self._column(df, 'TRANSACTION_TYPE')
+        refs = self._column(df, 'REFERENCE_ID')
+        amounts = self._convert_amounts(self._column(df, 'TRANSACTION_NET_AMOUNT'))
+
+        # Parse DD-MM-YYYY dates and add one day in a single vectorized pass;
+        # empty or invalid dates become NaT
+        dates = (
+            pd.to_datetime(date_strs, format='%d-%m-%Y', errors='coerce')
+            + pd.Timedelta(days=1)
+        )
+
+        # Strip transfer prefixes from the whole chunk at once
+        clean_types = types.str.replace(_TRANSFER_RE, '', regex=True).str.strip()
+
+        transactions = []
+
+        for parsed_date, transaction_type, clean_type, reference_id, amount in zip(
+            dates, types.to_numpy(), clean_types.to_numpy(), refs.to_numpy(), amounts.to_numpy()
+        ):
+            # Skip rows without a valid date (empty rows)
+            if parsed_date is pd.NaT:
+                continue
 
             # Build description
             description_parts = []
@@ -252,16 +245,15 @@ class MercadoPagoParser(TransactionParser):
 
             description = ' - '.join(description_parts) if description_parts else 'Transaction'
 
-            # Convert amount
-            amount = self._convert_to_integer(amount_str)
-            if amount is None:
+            # Skip unparseable amounts (NaN)
+            if amount != amount:
                 continue
 
             # Create transaction (MercadoPago uses ARS currency)
             transactions.append(Transaction(
                 date=parsed_date,
                 description=description,
-                amount=amount,
+                amount=int(amount),
                 currency=Currency.ARS,
                 raw_data={
                     'transaction_type': transaction_type,
@@ -2,6 +2,7 @@
 Santander-specific transaction parser.
 """
 
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime, timedelta
@@ -11,6 +12,18 @@ from .base import TransactionParser
 from ..models import Transaction, Currency
 
 
+# Currency symbols and whitespace stripped from amounts, compiled once
+_CURRENCY_RE = re.compile(r'[U$DS\s]')
+
+# First-cell prefixes that mark the end of a statement section
+_SECTION_END_PREFIXES = ('Tarjeta de', 'Pago de', 'Últimos')
+
+
+def _is_blank(value: Any) -> bool:
+    """Check for None/NaN/empty without pandas scalar dispatch."""
+    return value is None or value != value or value == ''
+
+
 class SantanderParser(TransactionParser):
     """Parser for Santander Excel transaction files."""
 
@@ -22,10 +35,19 @@ class SantanderParser(TransactionParser):
         """
         Read Santander Excel file.
 
+        Uses the Rust-backed calamine engine when python-calamine is
+        installed (much faster than openpyxl on large workbooks),
+        falling back to the default engine otherwise.
+
         Returns:
             DataFrame with raw Excel data (no headers)
         """
-        return pd.read_excel(self.file_path, header=None)
+        # ImportError: python-calamine not installed. ValueError: pandas
+        # < 2.2 does not know the engine name at all.
+        try:
+            return pd.read_excel(self.file_path, header=None, engine='calamine')
+        except (ImportError, ValueError):
+            return pd.read_excel(self.file_path, header=None)
 
     def _sanitize_amount(self, value: Any) -> float | None:
         """
@@ -47,7 +69,7 @@ class SantanderParser(TransactionParser):
         value_str = str(value).strip()
 
         # Remove currency symbols and spaces
-        value_str = re.sub(r'[U$DS\s]', '', value_str)
+        value_str = _CURRENCY_RE.sub('', value_str)
 
         # Replace comma with dot for decimal separator
         value_str = value_str.replace('.', '').replace(',', '.')
@@ -103,7 +125,7 @@ class SantanderParser(TransactionParser):
         parts = []
 
         # Add descripcion (main description)
-        if pd.notna(descripcion) and descripcion != '':
+        if not _is_blank(descripcion):
             desc_str = str(descripcion).strip()
             # Remove trailing " - " if present
             if desc_str.endswith(' - '):
@@ -111,13 +133,12 @@ class SantanderParser(TransactionParser):
             if desc_str and desc_str != '-':
                 parts.append(desc_str)
 
-        # Add cuotas if exists and not empty
-        if pd.notna(cuotas) and str(cuotas).strip() not in ('', '-'):
-            parts.append(str(cuotas).strip())
-
-        # Add comprobante if exists and not empty
-        if pd.notna(comprobante) and str(comprobante).strip() not in ('', '-'):
-            parts.append(str(comprobante).strip())
+        # Add cuotas/comprobante if they exist and are not empty
+        for extra in (cuotas, comprobante):
+            if not _is_blank(extra):
+                extra_str = str(extra).strip()
+                if extra_str and extra_str != '-':
+                    parts.append(extra_str)
 
         return ' - '.join(parts)
 
@@ -138,11 +159,16 @@ class SantanderParser(TransactionParser):
         """
         transactions = []
 
+        # Work on a NumPy object view: row access is a plain array index
+        # instead of building a Series per .iloc call
+        arr = df.to_numpy(dtype=object, copy=False)
+        ncols = arr.shape[1]
+
         # Find the header row (should contain "Fecha", "Descripción", etc.)
         header_row = None
-        for i in range(start_row, min(start_row + 10, len(df))):
-            row = df.iloc[i]
-            if 'Fecha' in str(row.iloc[0]) or 'Fecha' in str(row.iloc[1]):
+        for i in range(start_row, min(start_row + 10, len(arr))):
+            row = arr[i]
+            if 'Fecha' in str(row[0]) or 'Fecha' in str(row[1]):
                 header_row = i
                 break
 
@@ -155,25 +181,29 @@ class SantanderParser(TransactionParser):
         # Keep track of last valid date for rows with empty date cells
         last_valid_date = None
 
+        # Cache parsed dates: statements repeat the same date across many
+        # rows (and carried-forward dates) so each raw value is parsed once
+        parsed_dates: dict = {}
+
         # Read until we hit an empty row or another section
-        for i in range(data_start, len(df)):
-            row = df.iloc[i]
+        for i in range(data_start, len(arr)):
+            row = arr[i]
 
             # Check if we've hit a new section or empty rows
-            first_cell = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ''
-            if first_cell.startswith('Tarjeta de') or first_cell.startswith('Pago de') or first_cell.startswith('Últimos'):
+            first_cell = str(row[0]).strip() if pd.notna(row[0]) else ''
+            if first_cell.startswith(_SECTION_END_PREFIXES):
                 break
 
             # Check if row has date (column A or B might have it)
             fecha = None
             col_offset = 0
 
-            if pd.notna(row.iloc[0]) and '/' in str(row.iloc[0]):
-                fecha = row.iloc[0]
+            if pd.notna(row[0]) and '/' in str(row[0]):
+                fecha = row[0]
                 col_offset = 0
                 last_valid_date = fecha  # Update last valid date
-            elif pd.notna(row.iloc[1]) and '/' in str(row.iloc[1]):
-                fecha = row.iloc[1]
+            elif pd.notna(row[1]) and '/' in str(row[1]):
+                fecha = row[1]
                 col_offset = 1
                 last_valid_date = fecha  # Update last valid date
             else:
@@ -184,25 +214,38 @@ class SantanderParser(TransactionParser):
             if fecha is None:
                 continue
 
-            # Extract columns based on offset
-            descripcion = row.iloc[1 + col_offset] if len(row) > 1 + col_offset else ''
-            cuotas = row.iloc[2 + col_offset] if len(row) > 2 + col_offset else ''
-            comprobante = row.iloc[3 + col_offset] if len(row) > 3 + col_offset else ''
-            monto_pesos = row.iloc[4 + col_offset] if len(row) > 4 + col_offset else ''
-            monto_dolares = row.iloc[5 + col_offset] if len(row) > 5 + col_offset else ''
+            # Extract columns based on offset: one bounds check per row,
+            # padding with '' when the sheet is narrower than expected
+            if ncols > 5 + col_offset:
+                descripcion, cuotas, comprobante, monto_pesos, monto_dolares = \
+                    row[1 + col_offset:6 + col_offset]
+            else:
+                cells = list(row[1 + col_offset:ncols])
+                cells += [''] * (5 - len(cells))
+                descripcion, cuotas, comprobante, monto_pesos, monto_dolares = cells
 
             # Skip if descripcion is empty (likely an empty row)
             if pd.isna(descripcion) or str(descripcion).strip() == '':
                 continue
 
-            # Parse date
-            parsed_date = self._format_date_plus_one(fecha)
+            # Parse date (cached per raw value)
+            parsed_date = parsed_dates.get(fecha)
             if parsed_date is None:
-                continue
+                parsed_date = self._format_date_plus_one(fecha)
+                if parsed_date is None:
+                    continue
+                parsed_dates[fecha] = parsed_date
 
             # Build description
             description = self._build_description(cuotas, descripcion, comprobante)
 
+            # Raw payload is identical for the ARS/USD pair; build it once
+            raw_data = {
+                'cuotas': cuotas,
+                'descripcion': descripcion,
+                'comprobante': comprobante
+            }
+
             # Create transactions for ARS
             amount_ars = self._sanitize_amount(monto_pesos)
             if amount_ars is not None:
@@ -211,11 +254,7 @@ class SantanderParser(TransactionParser):
                     description=description,
                     amount=amount_ars,
                     currency=Currency.ARS,
-                    raw_data={
-                        'cuotas': cuotas,
-                        'descripcion': descripcion,
-                        'comprobante': comprobante
-                    }
+                    raw_data=raw_data
                 ))
 
             # Create transactions for USD
@@ -226,11 +265,7 @@ class SantanderParser(TransactionParser):
                     description=description,
                     amount=amount_usd,
                     currency=Currency.USD,
-                    raw_data={
-                        'cuotas': cuotas,
-                        'descripcion': descripcion,
-                        'comprobante': comprobante
-                    }
+                    raw_data=raw_data
                 ))
 
         return transactions
@@ -247,20 +282,25 @@ class SantanderParser(TransactionParser):
         Returns:
             List of all Transaction objects
         """
-        all_transactions = []
-
-        # Find all sections
-        for i, row in raw_data.iterrows():
-            row_str = ' '.join([str(cell) for cell in row if pd.notna(cell)])
+        # Find all sections with one vectorized substring sweep per column
+        # instead of joining every row into a Python string
+        text = raw_data.fillna('').astype(str)
+        mask_pago = pd.Series(False, index=raw_data.index)
+        mask_tarjeta = pd.Series(False, index=raw_data.index)
+        mask_terminada = pd.Series(False, index=raw_data.index)
+
+        for col in text.columns:
+            values = text[col]
+            mask_pago |= values.str.contains('Pago de tarjeta y devoluciones', regex=False)
+            mask_tarjeta |= values.str.contains('Tarjeta de', regex=False)
+            mask_terminada |= values.str.contains('terminada en', regex=False)
+
+        # "Pago de tarjeta y devoluciones" rows and "Tarjeta de ... terminada en" rows
+        section_mask = mask_pago | (mask_tarjeta & mask_terminada)
+        section_starts = [int(i) for i in np.flatnonzero(section_mask.to_numpy())]
 
-            # Check for "Pago de tarjeta y devoluciones"
-            if 'Pago de tarjeta y devoluciones' in row_str:
-                transactions = self._extract_transactions_from_section(raw_data, i)
-                all_transactions.extend(transactions)
-
-            # Check for "Tarjeta de" sections
-            elif 'Tarjeta de' in row_str and 'terminada en' in row_str:
-                transactions = self._extract_transactions_from_section(raw_data, i)
-                all_transactions.extend(transactions)
+        all_transactions = []
+        for start in section_starts:
+            all_transactions.extend(self._extract_transactions_from_section(raw_data, start))
 
         return all_transactions
@@ -3,30 +3,48 @@ Terminal User Interface for the transaction parser.
 Smooth, polished interface inspired by Claude Code.
 """
 
+import importlib
 import sys
+import time
 from pathlib import Path
 
 from prompt_toolkit import prompt, print_formatted_text
-from prompt_toolkit.completion import PathCompleter, WordCompleter
+from prompt_toolkit.completion import PathCompleter, ThreadedCompleter, WordCompleter
 from prompt_toolkit.validation import Validator, ValidationError
 from prompt_toolkit.styles import Style
 from prompt_toolkit.formatted_text import FormattedText
 
-from .parsers import SantanderParser, MercadoPagoParser
 
-
-# Registry of available parsers
+# Registry of available parsers as 'module:class' references, resolved
+# lazily so the TUI starts without loading pandas/openpyxl
 PARSERS = {
-    'santander': SantanderParser,
-    'mercadopago': MercadoPagoParser,
+    'santander': 'transaction_parser.parsers.santander:SantanderParser',
+    'mercadopago': 'transaction_parser.parsers.mercadopago:MercadoPagoParser',
 }
 
+
+def _load_parser_class(provider: str):
+    """Resolve a provider's parser class from the registry."""
+    module_name, _, class_name = PARSERS[provider].partition(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 # Provider to file extension mapping
 PROVIDER_EXTENSIONS = {
     'santander': '.xlsx',
     'mercadopago': '.csv',
 }
 
+# Prompt constants, built once instead of per prompt iteration
+_PARSER_NAMES = tuple(PARSERS)
+_PROVIDERS_LIST = ', '.join(_PARSER_NAMES)
+_EXIT_TOKENS = frozenset(('exit', 'quit', 'q'))
+_PROVIDER_COMPLETER = WordCompleter(
+    list(_PARSER_NAMES),
+    ignore_case=True,
+    sentence=True,
+)
+
 # Smooth color palette
 STYLE = Style.from_dict({
     'prompt': '#00d4aa',
@@ -40,26 +58,99 @@ STYLE = Style.from_dict({
 })
 
 
+# Filesystem checks are cached briefly so validators don't re-stat the
+# same path on every prompt round-trip (noticeable on slow/NFS storage)
+_STAT_TTL = 1.0
+_stat_cache: dict[str, tuple[bool, bool, bool, float]] = {}
+
+
+def _stat_cached(path: Path) -> tuple[bool, bool, bool]:
+    """
+    Get (exists, is_file, is_dir) for a path, cached for a short TTL.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        Tuple of (exists, is_file, is_dir)
+    """
+    key = str(path)
+    now = time.monotonic()
+    entry = _stat_cache.get(key)
+    if entry is not None and entry[3] > now:
+        return entry[0], entry[1], entry[2]
+
+    exists = path.exists()
+    is_file = exists and path.is_file()
+    is_dir = exists and path.is_dir()
+
+    if len(_stat_cache) > 512:
+        _stat_cache.clear()
+    _stat_cache[key] = (exists, is_file, is_dir, now + _STAT_TTL)
+
+    return exists, is_file, is_dir
+
+
+class CachedPathCompleter(PathCompleter):
+    """
+    PathCompleter with a short-TTL completion cache.
+
+    PathCompleter re-scans the directory on every keystroke; caching the
+    completion list briefly per input text keeps typing responsive on
+    slow storage without showing stale listings for long.
+    """
+
+    _TTL = 0.5
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._cache: dict[str, tuple[list, float]] = {}
+
+    def get_completions(self, document, complete_event):
+        key = document.text_before_cursor
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and entry[1] > now:
+            yield from entry[0]
+            return
+
+        completions = list(super().get_completions(document, complete_event))
+        if len(self._cache) > 256:
+            self._cache.clear()
+        self._cache[key] = (completions, now + self._TTL)
+        yield from completions
+
+
 class FileValidator(Validator):
     """Validator to check if file exists."""
 
+    def __init__(self):
+        # Last successfully validated input and its expanded Path, kept
+        # so the prompt loop doesn't rebuild the Path it just checked
+        self.last_valid_text: str | None = None
+        self.last_valid_path: Path | None = None
+
     def validate(self, document):
         text = document.text.strip()
         if not text:
             return  # Allow empty for default values
 
         path = Path(text).expanduser()
-        if not path.exists():
+        exists, is_file, _ = _stat_cached(path)
+        if not exists:
             raise ValidationError(
                 message=f'File not found: {text}',
                 cursor_position=len(text)
             )
-        if not path.is_file():
+        if not is_file:
             raise ValidationError(
                 message=f'Not a file: {text}',
                 cursor_position=len(text)
             )
 
+        self.last_valid_text = text
+        self.last_valid_path = path
+
 
 class DirectoryValidator(Validator):
     """Validator to check if directory path is valid."""
@@ -69,26 +160,46 @@ class DirectoryValidator(Validator):
         if not text:
             return  # Allow empty for default
 
-        path = Path(text).expanduser()
-        if path.exists() and not path.is_dir():
+        exists, _, is_dir = _stat_cached(Path(text).expanduser())
+        if exists and not is_dir:
             raise ValidationError(
                 message=f'Not a directory: {text}',
                 cursor_position=len(text)
             )
 
 
+# Horizontal rule, built once
+_BAR = '━' * 70
+
+
 def print_msg(text: str, style: str = ''):
     """Print a formatted message."""
     style_class = f'class:{style}' if style else ''
     print_formatted_text(FormattedText([(style_class, text)]), style=STYLE)
 
 
+def print_block(lines: list[tuple[str, str]]):
+    """
+    Print several styled lines with a single terminal write.
+
+    Args:
+        lines: List of (style, text) tuples, one per line
+    """
+    fragments = [
+        (f'class:{style}' if style else '', f'{text}\n')
+        for style, text in lines
+    ]
+    print_formatted_text(FormattedText(fragments), style=STYLE, end='')
+
+
 def print_header():
     """Print smooth header."""
-    print_msg('━' * 70, 'dim')
-    print_msg('  Transaction Parser', 'title')
-    print_msg('━' * 70, 'dim')
-    print()
+    print_block([
+        ('dim', _BAR),
+        ('title', '  Transaction Parser'),
+        ('dim', _BAR),
+        ('', ''),
+    ])
 
 
 def print_step(number: int, title: str):
@@ -130,58 +241,47 @@ def select_provider() -> str:
     print_step(1, 'Select Provider')
 
     # Show available providers
-    providers_list = ', '.join(PARSERS.keys())
-    print_hint(f'Available: {providers_list}')
+    print_hint(f'Available: {_PROVIDERS_LIST}')
     print_hint("Type 'exit' or press Ctrl+C to quit")
     print()
 
-    provider_completer = WordCompleter(
-        list(PARSERS.keys()),
-        ignore_case=True,
-        sentence=True,
-    )
-
+    # Ctrl+C/EOF bubble up to run_interactive_mode's single handler
     while True:
-        try:
-            provider = prompt(
-                FormattedText([
-                    ('class:prompt-arrow', '› '),
-                    ('class:prompt', 'Provider: '),
-                ]),
-                completer=provider_completer,
-                style=STYLE,
-                complete_while_typing=True,
-            ).strip().lower()
-
-            # Check for exit
-            if provider in ('exit', 'quit', 'q'):
-                print()
-                print_msg('Goodbye! 👋', 'dim')
-                print()
-                sys.exit(0)
-
-            if not provider:
-                print()
-                print_error('Please select a provider')
-                print()
-                continue
-
-            if provider in PARSERS:
-                print()
-                print_success(f'Using {provider}')
-                return provider
-            else:
-                print()
-                print_error(f'Unknown provider: {provider}')
-                print_hint(f'Available: {providers_list}')
-                print()
+        provider = prompt(
+            FormattedText([
+                ('class:prompt-arrow', '› '),
+                ('class:prompt', 'Provider: '),
+            ]),
+            completer=_PROVIDER_COMPLETER,
+            style=STYLE,
+            # Two choices only: completing on Tab instead of every
+            # keystroke avoids pointless redraws while typing
+            complete_while_typing=False,
+        ).strip().lower()
 
-        except (KeyboardInterrupt, EOFError):
-            print('\n')
+        # Check for exit
+        if provider in _EXIT_TOKENS:
+            print()
             print_msg('Goodbye! 👋', 'dim')
             print()
             sys.exit(0)
 
+        if not provider:
+            print()
+            print_error('Please select a provider')
+            print()
+            continue
+
+        if provider in PARSERS:
+            print()
+            print_success(f'Using {provider}')
+            return provider
+        else:
+            print()
+            print_error(f'Unknown provider: {provider}')
+            print_hint(f'Available: {_PROVIDERS_LIST}')
+            print()
+
 
 def select_input_file(provider: str) -> Path:
     """Select input file with autocomplete."""
@@ -195,71 +295,70 @@ def select_input_file(provider: str) -> Path:
     print_hint("Type 'exit' or press Ctrl+C to quit")
     print()
 
-    file_completer = PathCompleter(
+    # ThreadedCompleter keeps directory stat work off the render thread,
+    # so typing stays responsive while completions are generated
+    file_completer = ThreadedCompleter(CachedPathCompleter(
         only_directories=False,
         expanduser=True,
-    )
+    ))
+    file_validator = FileValidator()
 
+    # Validator failures are rendered inline by prompt_toolkit (it
+    # re-prompts instead of raising), and Ctrl+C/EOF bubble up to
+    # run_interactive_mode's single handler
     while True:
-        try:
-            file_path = prompt(
-                FormattedText([
-                    ('class:prompt-arrow', '› '),
-                    ('class:prompt', 'File: '),
-                ]),
-                completer=file_completer,
-                validator=FileValidator(),
-                validate_while_typing=False,
-                style=STYLE,
-                complete_while_typing=True,
-            ).strip()
+        file_path = prompt(
+            FormattedText([
+                ('class:prompt-arrow', '› '),
+                ('class:prompt', 'File: '),
+            ]),
+            completer=file_completer,
+            validator=file_validator,
+            validate_while_typing=False,
+            style=STYLE,
+            complete_while_typing=True,
+        ).strip()
 
-            # Check for exit
-            if file_path.lower() in ('exit', 'quit', 'q'):
-                print()
-                print_msg('Goodbye! 👋', 'dim')
-                print()
-                sys.exit(0)
+        # Check for exit
+        if file_path.lower() in _EXIT_TOKENS:
+            print()
+            print_msg('Goodbye! 👋', 'dim')
+            print()
+            sys.exit(0)
 
-            if not file_path:
-                print()
-                print_error('Please select a file')
-                print()
-                continue
+        if not file_path:
+            print()
+            print_error('Please select a file')
+            print()
+            continue
 
+        # Reuse the Path the validator already expanded and checked
+        if file_path == file_validator.last_valid_text:
+            path = file_validator.last_valid_path.resolve()
+        else:
             path = Path(file_path).expanduser().resolve()
 
-            # Check extension
-            if expected_ext and path.suffix.lower() != expected_ext:
-                print()
-                print_warning(f'Expected {expected_ext}, got {path.suffix}')
-
-                confirm = prompt(
-                    FormattedText([
-                        ('class:prompt-arrow', '› '),
-                        ('class:warning', 'Continue anyway? (y/n): '),
-                    ]),
-                    style=STYLE,
-                ).strip().lower()
+        # Check extension
+        if expected_ext and path.suffix.lower() != expected_ext:
+            print()
+            print_warning(f'Expected {expected_ext}, got {path.suffix}')
 
-                if confirm not in ('y', 'yes'):
-                    print()
-                    continue
+            confirm = prompt(
+                FormattedText([
+                    ('class:prompt-arrow', '› '),
+                    ('class:warning', 'Continue anyway? (y/n): '),
+                ]),
+                style=STYLE,
+            ).strip().lower()
 
-            print()
-            print_success(f'{path.name}')
-            print_hint(f'  {path.parent}')
-            return path
+            if confirm not in ('y', 'yes'):
+                print()
+                continue
 
-        except ValidationError as e:
-            print()
-            print_error(str(e.message))
-            print()
-        except (KeyboardInterrupt, EOFError):
-            print('\n')
-            print_msg('Goodbye! 👋', 'dim')
-            print()
-            sys.exit(0)
+        print()
+        print_success(f'{path.name}')
+        print_hint(f'  {path.parent}')
+        return path
 
 
 def select_output_folder() -> Path:
@@ -271,74 +370,65 @@ def select_output_folder() -> Path:
     print_hint("Type 'exit' or press Ctrl+C to quit")
     print()
 
-    dir_completer = PathCompleter(
+    dir_completer = ThreadedCompleter(CachedPathCompleter(
         only_directories=True,
         expanduser=True,
-    )
+    ))
+    dir_validator = DirectoryValidator()
 
+    # Ctrl+C/EOF bubble up to run_interactive_mode's single handler
     while True:
-        try:
-            output_dir = prompt(
+        output_dir = prompt(
+            FormattedText([
+                ('class:prompt-arrow', '› '),
+                ('class:prompt', 'Output: '),
+                ('class:dim', '[.]'),
+                ('', ' '),
+            ]),
+            completer=dir_completer,
+            validator=dir_validator,
+            validate_while_typing=False,
+            style=STYLE,
+            complete_while_typing=True,
+            default='',
+        ).strip()
+
+        # Check for exit
+        if output_dir.lower() in _EXIT_TOKENS:
+            print()
+            print_msg('Goodbye! 👋', 'dim')
+            print()
+            sys.exit(0)
+
+        if not output_dir:
+            output_dir = '.'
+
+        path = Path(output_dir).expanduser().resolve()
+
+        # Create directory if needed
+        if not path.exists():
+            print()
+            print_info(f'Directory does not exist: {path}')
+
+            confirm = prompt(
                 FormattedText([
                     ('class:prompt-arrow', '› '),
-                    ('class:prompt', 'Output: '),
-                    ('class:dim', '[.]'),
-                    ('', ' '),
+                    ('class:prompt', 'Create? (y/n): '),
                 ]),
-                completer=dir_completer,
-                validator=DirectoryValidator(),
-                validate_while_typing=False,
                 style=STYLE,
-                complete_while_typing=True,
-                default='',
-            ).strip()
+            ).strip().lower()
 
-            # Check for exit
-            if output_dir.lower() in ('exit', 'quit', 'q'):
-                print()
-                print_msg('Goodbye! 👋', 'dim')
+            if confirm in ('y', 'yes'):
+                path.mkdir(parents=True, exist_ok=True)
                 print()
-                sys.exit(0)
-
-            if not output_dir:
-                output_dir = '.'
-
-            path = Path(output_dir).expanduser().resolve()
-
-            # Create directory if needed
-            if not path.exists():
+                print_success(f'Created {path}')
+            else:
                 print()
-                print_info(f'Directory does not exist: {path}')
-
-                confirm = prompt(
-                    FormattedText([
-                        ('class:prompt-arrow', '› '),
-                        ('class:prompt', 'Create? (y/n): '),
-                    ]),
-                    style=STYLE,
-                ).strip().lower()
-
-                if confirm in ('y', 'yes'):
-                    path.mkdir(parents=True, exist_ok=True)
-                    print()
-                    print_success(f'Created {path}')
-                else:
-                    print()
-                    continue
-
-            print()
-            print_success(f'{path}')
-            return path
+                continue
 
-        except ValidationError as e:
-            print()
-            print_error(str(e.message))
-            print()
-        except (KeyboardInterrupt, EOFError):
-            print('\n')
-            print_msg('Goodbye! 👋', 'dim')
-            print()
-            sys.exit(0)
+        print()
+        print_success(f'{path}')
+        return path
 
 
 def process_transactions(provider: str, input_file: Path, output_dir: Path) -> bool:
@@ -348,21 +438,23 @@ def process_transactions(provider: str, input_file: Path, output_dir: Path) -> b
     try:
         # Parse
         print_info('Parsing transactions...')
-        parser_class = PARSERS[provider]
+        parser_class = _load_parser_class(provider)
         parser = parser_class(input_file)
         batches = parser.parse()
 
-        # Summary
+        # Summary, emitted as one write instead of a print per line
         total = sum(len(batch) for batch in batches.values())
-        print()
-        print_success(f'Found {total} transactions', indent=True)
-
-        for currency, batch in batches.items():
-            print_info(f'  {currency.value}: {len(batch)}', indent=True)
-
-        # Export
-        print()
-        print_info('Exporting to CSV...')
+        summary = [
+            ('', ''),
+            ('success', f'  ✓ Found {total} transactions'),
+        ]
+        summary.extend(
+            ('info', f'    {currency.value}: {len(batch)}')
+            for currency, batch in batches.items()
+        )
+        summary.append(('', ''))
+        summary.append(('info', 'Exporting to CSV...'))
+        print_block(summary)
 
         output_files = parser.export_to_csv(
             batches,
@@ -370,18 +462,19 @@ def process_transactions(provider: str, input_file: Path, output_dir: Path) -> b
             filename_pattern='transactions_{currency}.csv'
         )
 
-        # Results
-        print()
-        print_success('Completed!', indent=True)
-        print()
-
+        # Results, likewise coalesced into a single terminal write
+        results = [
+            ('', ''),
+            ('success', '  ✓ Completed!'),
+            ('', ''),
+        ]
         for currency, file_path in output_files.items():
             batch = batches[currency]
-            print_info(f'  {file_path.name} ({len(batch)} rows)', indent=True)
-            print_hint(f'    {file_path.parent}')
-
-        print()
-        print_msg('━' * 70, 'dim')
+            results.append(('info', f'    {file_path.name} ({len(batch)} rows)'))
+            results.append(('dim', f'      {file_path.parent}'))
+        results.append(('', ''))
+        results.append(('dim', _BAR))
+        print_block(results)
 
         return True
 